@@ -45,12 +45,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         hass.data[DOMAIN][entry.entry_id].setdefault(CONF_DISCOVERED_DEVICES, {})
 
-        detected_devices = await discover()
+        # Fetch the device lists of all homes concurrently. These run on Home Assistant's
+        # shared executor, which core sizes and shuts down itself - don't replace it here.
+        # A failing home fails the whole setup instead of silently dropping its devices
+        results = await asyncio.gather(
+            *[hass.async_add_executor_job(tuya_session.list_devices, home["groupId"]) for home in homes]
+        )
+        devices_by_home = list(zip(homes, results))
+
+        # Collect the device IDs first so discovery can stop as soon as all of them answered
+        expected_ids = {device["devId"] for _, devices_for_home in devices_by_home for device in devices_for_home}
+
+        detected_devices = await discover(expected_ids=expected_ids)
         logger.debug("Detected devices on local network: %s", list(detected_devices.keys()))
 
-        for home in homes:
-            devices_for_home = await hass.async_add_executor_job(tuya_session.list_devices, home["groupId"])
-
+        coordinators = {}
+        for home, devices_for_home in devices_by_home:
             for device in devices_for_home:
                 logger.debug("Got Tuya device in home group %s: %s", home["groupId"], device)
 
@@ -82,21 +92,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                         local_key=local_key,
                     )
 
-                    # Try to get initial data, but don't fail if it doesn't work
-                    try:
-                        await coordinator.async_config_entry_first_refresh()
-                    except Exception as e:
-                        logger.warning(
-                            "Could not get initial data for device %s at %s: %s",
-                            device_id,
-                            device_ip,
-                            e,
-                        )
-                        # Still add the device, it might come online later
-
-                    hass.data[DOMAIN][entry.entry_id][CONF_DISCOVERED_DEVICES][hass_entity_id] = {
-                        CONF_COORDINATOR: coordinator
-                    }
+                    coordinators[hass_entity_id] = coordinator
                 else:
                     logger.warning(
                         "Could not find device %s on the local network. "
@@ -105,6 +101,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                         list(detected_devices.keys()) if detected_devices else "none",
                     )
 
+        # Try to get initial data for all devices at once, but don't fail if it doesn't work
+        results = await asyncio.gather(
+            *[coordinator.async_config_entry_first_refresh() for coordinator in coordinators.values()],
+            return_exceptions=True,
+        )
+
+        for (hass_entity_id, coordinator), result in zip(coordinators.items(), results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "Could not get initial data for device %s at %s: %s",
+                    coordinator.tuya_client.device_id,
+                    coordinator.tuya_client.host,
+                    result,
+                )
+                # Still add the device, it might come online later
+
+            hass.data[DOMAIN][entry.entry_id][CONF_DISCOVERED_DEVICES][hass_entity_id] = {
+                CONF_COORDINATOR: coordinator
+            }
+
     except Exception:
         # TODO: raise proper exception
         logger.exception("Exception when trying to get initial user info and devices")
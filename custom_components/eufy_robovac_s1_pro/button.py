@@ -66,7 +66,8 @@ class MaintenanceResetButton(CoordinatorTuyaDeviceUniqueIDMixin, CoordinatorEnti
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.data is not None and RobovacDPs.ROBOVAC_REPLACE_DPS_ID_115 in self.coordinator.data
+        data = self.coordinator.data
+        return data is not None and RobovacDPs.ROBOVAC_REPLACE_DPS_ID_115 in data
 
     async def async_press(self) -> None:
         await self.coordinator.tuya_client.async_set({RobovacDPs.ROBOVAC_REPLACE_DPS_ID_115: self.dp_value_to_set})
@@ -38,17 +38,24 @@ class RobovacDPs(StrEnum):
     ROBOVAC_AREA_CLEAN_DPS_ID_116 = "116"
     ROBOVAC_AREA_SET_DPS_ID_124 = "124"
     ROBOVAC_AUTO_RETURN_CLEAN_DPS_ID_156 = "156"
+    ROBOVAC_BATTERY_DPS_ID_8 = "8"
+    ROBOVAC_BATTERY_DPS_ID_163 = "163"  # Battery level fallback
     ROBOVAC_BOOST_IQ_DPS_ID_118 = "118"
     ROBOVAC_CLEAN_MODE_DPS_ID_5 = "5"
+    ROBOVAC_CLEAN_STATISTICS_DPS_ID_167 = "167"
     ROBOVAC_CLEAR_AREA_DPS_ID_110 = "110"
     ROBOVAC_CLEAR_TIME_DPS_ID_109 = "109"
     ROBOVAC_CLEAR_TOTAL_AREA_DPS_ID_120 = "120"
     ROBOVAC_CLEAR_TOTAL_TIME_DPS_ID_119 = "119"
+    ROBOVAC_COMMAND_DPS_ID_152 = "152"
+    ROBOVAC_CONSUMABLES_DPS_ID_168 = "168"
     ROBOVAC_DIRECTION_DPS_ID_3 = "3"
     ROBOVAC_DO_NOT_DISTURB_DPS_ID_139 = "139"
     ROBOVAC_EDIT_ROOM_DPS_ID_141 = "141"
     ROBOVAC_ELECTRIC_DPS_ID_104 = "104"
     ROBOVAC_ERROR_ALARM_DPS_ID_106 = "106"
+    ROBOVAC_FAN_SPEED_DPS_ID_9 = "9"
+    ROBOVAC_FAN_SPEED_DPS_ID_158 = "158"
     ROBOVAC_FILETR_TM_DPS_ID_114 = "114"
     ROBOVAC_FIND_ROBOVAC_DPS_ID_103 = "103"
     ROBOVAC_G40_CHARING_TYPE = "143"
@@ -80,6 +87,9 @@ class RobovacDPs(StrEnum):
     ROBOVAC_SETTING_DPS_ID_126 = "126"
     ROBOVAC_SIDE_BSHTM_DPS_ID_112 = "112"
     ROBOVAC_SMART_ROOMS_DPS_ID_140 = "140"
+    ROBOVAC_STATUS_DPS_ID_6 = "6"  # Also the error code (>= 100)
+    ROBOVAC_STATUS_DPS_ID_7 = "7"
+    ROBOVAC_STATUS_DETAIL_DPS_ID_153 = "153"
     ROBOVAC_VOICE_DEFAULT_SET_DPS_ID_128 = "128"
     ROBOVAC_VOICE_TYPE_SET_DPS_ID_125 = "125"
 
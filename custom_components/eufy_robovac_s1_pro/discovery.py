@@ -11,53 +11,84 @@ https://github.com/ct-Open-Source/tuya-convert/blob/master/scripts/tuya-discover
 import asyncio
 import json
 import logging
+import socket
 from hashlib import md5
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from homeassistant.util.json import json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
 UDP_KEY = md5(b"yGAdlopoPVldABfn").digest()
 
+# The key is fixed, so build the cipher once instead of on every datagram
+UDP_CIPHER = Cipher(algorithms.AES(UDP_KEY), modes.ECB(), default_backend())
+
+# Every Tuya frame starts with this prefix; 20 byte header + 8 byte CRC/suffix
+UDP_PREFIX = b"\x00\x00\x55\xaa"
+UDP_MIN_LENGTH = 32
+
 DEFAULT_TIMEOUT = 6.0
 
+# Plain (6666) and encrypted (6667) broadcast ports
+DISCOVERY_PORTS = (6666, 6667)
+
+# Larger kernel receive buffer so the burst of beacons at startup is not dropped
+RECEIVE_BUFFER_SIZE = 1 << 20
+
 
 def decrypt_udp(message):
-    """Decrypt encrypted UDP broadcasts."""
+    """Decrypt encrypted UDP broadcasts.
+
+    Returns the raw UTF-8 JSON bytes, which ``json_loads`` parses directly.
+    """
 
     def _unpad(data):
-        return data[: -ord(data[len(data) - 1 :])]
+        pad = data[-1]
+        if not 1 <= pad <= 16:
+            raise ValueError("Invalid padding")
+        return data[:-pad]
 
-    cipher = Cipher(algorithms.AES(UDP_KEY), modes.ECB(), default_backend())
-    decryptor = cipher.decryptor()
-    return _unpad(decryptor.update(message) + decryptor.finalize()).decode()
+    decryptor = UDP_CIPHER.decryptor()
+    return _unpad(decryptor.update(message) + decryptor.finalize())
 
 
 class TuyaDiscovery(asyncio.DatagramProtocol):
     """Datagram handler listening for Tuya broadcast messages."""
 
-    def __init__(self, callback=None):
-        """Initialize a new BaseDiscovery."""
+    def __init__(self, callback=None, expected_ids=None):
+        """Initialize a new BaseDiscovery.
+
+        If ``expected_ids`` is given, only those devices are kept and discovery
+        is considered done as soon as every one of them has been seen.
+        """
         self.devices = {}
+        self._ignored_ids = set()
         self._listeners = []
+        self._loop = None
         self._callback = callback
+        self._expected_ids = frozenset(expected_ids) if expected_ids is not None else None
+        self._done = asyncio.Event()
+        if self._expected_ids is not None and not self._expected_ids:
+            self._done.set()
 
     async def start(self):
         """Start discovery by listening to broadcasts."""
-        loop = asyncio.get_running_loop()
+        loop = self._loop = asyncio.get_running_loop()
         
-        # Use reuse_port parameter directly as in CodeFoodPixels implementation
-        listener = loop.create_datagram_endpoint(
-            lambda: self, local_addr=("0.0.0.0", 6666), reuse_port=True
-        )
-        encrypted_listener = loop.create_datagram_endpoint(
-            lambda: self, local_addr=("0.0.0.0", 6667), reuse_port=True
-        )
+        # Use reuse_port parameter directly as in CodeFoodPixels implementation.
+        # One socket per port is enough: the kernel copies broadcasts to every
+        # socket sharing a port, so extra SO_REUSEPORT sockets would only
+        # duplicate work on this single event loop.
+        listeners = [
+            loop.create_datagram_endpoint(lambda: self, local_addr=("0.0.0.0", port), reuse_port=True)
+            for port in DISCOVERY_PORTS
+        ]
 
         try:
-            self._listeners = await asyncio.gather(listener, encrypted_listener)
-            _LOGGER.debug("Listening to broadcasts on UDP port 6666 and 6667")
+            self._listeners = await asyncio.gather(*listeners)
+            _LOGGER.debug("Listening to broadcasts on UDP ports %s", DISCOVERY_PORTS)
         except Exception as e:
             _LOGGER.exception(
                 "Failed to start discovery on ports 6666 and 6667. "
@@ -67,6 +98,13 @@ class TuyaDiscovery(asyncio.DatagramProtocol):
             # Don't raise, allow integration to continue without discovery
             self._listeners = []
 
+        for transport, _ in self._listeners:
+            try:
+                sock = transport.get_extra_info("socket")
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, RECEIVE_BUFFER_SIZE)
+            except (AttributeError, OSError) as e:
+                _LOGGER.debug("Could not enlarge discovery receive buffer: %s", e)
+
     def close(self, *args, **kwargs):
         """Stop discovery."""
         self._callback = None
@@ -78,40 +116,77 @@ class TuyaDiscovery(asyncio.DatagramProtocol):
                 _LOGGER.debug("Error closing listener: %s", e)
 
     def datagram_received(self, data, addr):
-        """Handle received broadcast message."""
-        data = data[20:-8]
-        try:
-            data = decrypt_udp(data)
-        except Exception:  # pylint: disable=broad-except
+        """Handle received broadcast message.
+
+        Parsing is deferred to the next loop iteration so the protocol returns
+        immediately and the socket keeps draining.
+        """
+        # Drop anything that isn't a Tuya frame before doing any work
+        if len(data) < UDP_MIN_LENGTH or data[:4] != UDP_PREFIX:
+            return
+
+        self._loop.call_soon(self._handle, data[20:-8], addr)
+
+    def _handle(self, payload, addr):
+        """Decrypt and parse a broadcast payload."""
+        candidates = []
+        # Encrypted payloads are whole AES blocks, anything else can only be plain JSON
+        if len(payload) % 16 == 0:
             try:
-                data = data.decode()
-            except Exception:
-                _LOGGER.debug("Could not decode datagram from %s", addr)
-                return
+                candidates.append(decrypt_udp(payload))
+            except Exception:  # pylint: disable=broad-except
+                pass
+        # Not encrypted (port 6666 broadcasts), or a plaintext payload that "decrypted" to garbage
+        candidates.append(payload)
 
-        try:
-            decoded = json.loads(data)
+        for data in candidates:
+            try:
+                decoded = json_loads(data)
+            except json.JSONDecodeError:
+                continue
             self.device_found(decoded)
-        except json.JSONDecodeError:
-            _LOGGER.debug("Could not parse JSON from %s: %s", addr, data)
+            return
+
+        _LOGGER.debug("Could not parse JSON from %s: %s", addr, payload)
 
     def device_found(self, device):
         """Discover a new device."""
         device_id = device.get("gwId")
+        if self._expected_ids is not None and device_id not in self._expected_ids:
+            # Keep unexpected devices visible in the debug log, once per device
+            if device_id not in self._ignored_ids:
+                self._ignored_ids.add(device_id)
+                _LOGGER.debug("Ignoring device not in the account: %s", device)
+            return
+
         if device_id and device_id not in self.devices:
             self.devices[device_id] = device
             _LOGGER.debug("Discovered device: %s", device)
 
+            if self._expected_ids is not None and len(self.devices) == len(self._expected_ids):
+                self._done.set()
+
         if self._callback:
             self._callback(device)
 
+    async def wait(self, timeout):
+        """Wait until all expected devices were found or the timeout expires."""
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def discover(expected_ids=None):
+    """Discover and return devices on local network.
 
-async def discover():
-    """Discover and return devices on local network."""
-    discovery = TuyaDiscovery()
+    Returns early once all ``expected_ids`` have been found, otherwise after
+    ``DEFAULT_TIMEOUT`` seconds.
+    """
+    discovery = TuyaDiscovery(expected_ids=expected_ids)
     try:
         await discovery.start()
-        await asyncio.sleep(DEFAULT_TIMEOUT)
+        await discovery.wait(DEFAULT_TIMEOUT)
     finally:
         discovery.close()
     return discovery.devices
@@ -53,8 +53,8 @@ class VolumeNumberInput(CoordinatorTuyaDeviceUniqueIDMixin, CoordinatorEntity, N
 
     @property
     def native_value(self) -> float | None:
-        if self.coordinator.data:
-            value = self.coordinator.data.get(RobovacDPs.ROBOVAC_LOUDNESS_DPS_ID_111)
+        if data := self.coordinator.data:
+            value = data.get(RobovacDPs.ROBOVAC_LOUDNESS_DPS_ID_111)
             if value is not None:
                 try:
                     return float(value)
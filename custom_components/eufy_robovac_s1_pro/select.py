@@ -1,7 +1,7 @@
 """Select platform for Eufy Robovac."""
 import logging
 from typing import Any
-import asyncio
+import sys
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
@@ -39,13 +39,14 @@ CLEANING_MODES = {
     }
 }
 
-# Map DPS values to mode names
+# Map DPS values to mode keys (and option names back to mode keys), derived from CLEANING_MODES
 DPS_TO_MODE_MAP = {
-    ("FAoKCgASABoAIgIIAhIGCAEQASAB", None): "vacuum",
-    ("FAoKCgIIAhIAGgAiABIGCAEQASAB", "low"): "mop_low",
-    ("FgoMCgIIAhIAGgAiAggBEgYIARABIAE=", "middle"): "mop_middle",
-    ("FgoMCgIIAhIAGgAiAggCEgYIARABIAE=", "high"): "mop_high",
+    (sys.intern(mode_config["dps154"]), mode_config["dps10"]): mode_key
+    for mode_key, mode_config in CLEANING_MODES.items()
 }
+NAME_TO_MODE_MAP = {mode_config["name"]: mode_key for mode_key, mode_config in CLEANING_MODES.items()}
+CLEANING_MODE_OPTIONS = [mode_config["name"] for mode_config in CLEANING_MODES.values()]
+WATER_LEVELS = frozenset(mode_config["dps10"] for mode_config in CLEANING_MODES.values() if mode_config["dps10"])
 
 
 async def async_setup_entry(
@@ -87,8 +88,7 @@ class CleaningModeSelect(CoordinatorEntity, RestoreEntity, SelectEntity):
         last_state = await self.async_get_last_state()
         if last_state and last_state.state not in (None, "unknown", "unavailable"):
             # Validate that restored value is a known option
-            valid_options = [CLEANING_MODES[m]["name"] for m in CLEANING_MODES]
-            if last_state.state in valid_options:
+            if last_state.state in NAME_TO_MODE_MAP:
                 self._restored_option = last_state.state
                 logger.debug("Restored Cleaning Mode: %s", self._restored_option)
         
@@ -105,65 +105,53 @@ class CleaningModeSelect(CoordinatorEntity, RestoreEntity, SelectEntity):
     @property
     def options(self) -> list[str]:
         """Return available options."""
-        return [CLEANING_MODES[mode]["name"] for mode in CLEANING_MODES.keys()]
+        return CLEANING_MODE_OPTIONS
 
     @property
     def current_option(self) -> str | None:
         """Return the currently selected option."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return self._restored_option
         
-        dps154 = self.coordinator.data.get("154", "")
-        dps10 = self.coordinator.data.get("10", None)
+        dps154 = data.get("154", "")
+        dps10 = data.get("10", None)
         
         # Check if DPS 10 is a string (water level)
-        if isinstance(dps10, str) and dps10 in ["low", "middle", "high"]:
+        if isinstance(dps10, str) and dps10 in WATER_LEVELS:
             water_level = dps10
         else:
             water_level = None
         
-        # Try to find matching mode
-        mode_key = (dps154, water_level)
-        if mode_key in DPS_TO_MODE_MAP:
-            mode = DPS_TO_MODE_MAP[mode_key]
-            if mode in CLEANING_MODES:
-                return CLEANING_MODES[mode]["name"]
-        
-        # Try without water level (vacuum mode)
-        if dps154 == CLEANING_MODES["vacuum"]["dps154"]:
-            return CLEANING_MODES["vacuum"]["name"]
+        # Try to find matching mode, falling back to vacuum mode which ignores the water level
+        mode = DPS_TO_MODE_MAP.get((dps154, water_level)) or DPS_TO_MODE_MAP.get((dps154, None))
+        if mode:
+            return CLEANING_MODES[mode]["name"]
         
         return None
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
         # Find the mode by name
-        selected_mode = None
-        for mode_key, mode_config in CLEANING_MODES.items():
-            if mode_config["name"] == option:
-                selected_mode = mode_key
-                break
+        selected_mode = NAME_TO_MODE_MAP.get(option)
         
         if not selected_mode:
-            logger.error(f"Invalid cleaning mode selected: {option}")
+            logger.error("Invalid cleaning mode selected: %s", option)
             return
         
         mode_config = CLEANING_MODES[selected_mode]
-        logger.info(f"Setting cleaning mode to: {mode_config['name']}")
+        logger.info("Setting cleaning mode to: %s", mode_config["name"])
         
         try:
-            # Set DPS 154
-            await self.coordinator.tuya_client.async_set({"154": mode_config["dps154"]})
-            await asyncio.sleep(0.5)
-            
-            # Set DPS 10 if needed (for mopping modes)
+            # Set DPS 154, plus DPS 10 for mopping modes, in a single SET
+            payload = {"154": mode_config["dps154"]}
             if mode_config["dps10"]:
-                await self.coordinator.tuya_client.async_set({"10": mode_config["dps10"]})
-            await asyncio.sleep(0.5)
+                payload["10"] = mode_config["dps10"]
+            await self.coordinator.tuya_client.async_set(payload)
             
             # Refresh state
             await self.coordinator.async_request_refresh()
             
-            logger.info(f"Cleaning mode set to: {mode_config['name']}")
+            logger.info("Cleaning mode set to: %s", mode_config["name"])
         except Exception as e:
-            logger.error(f"Failed to set cleaning mode: {e}")
+            logger.error("Failed to set cleaning mode: %s", e)
@@ -8,16 +8,22 @@ from homeassistant.helpers.icon import icon_for_battery_level
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 import base64
+import functools
 import logging
 
-from .const import CONF_COORDINATOR, CONF_DISCOVERED_DEVICES, DOMAIN
+from .const import CONF_COORDINATOR, CONF_DISCOVERED_DEVICES, DOMAIN, RobovacDPs
 from .coordinators import EufyTuyaDataUpdateCoordinator
 from .mixins import CoordinatorTuyaDeviceUniqueIDMixin
 # vacuum.pyから状態判定関数と説明文をインポート
-from .vacuum import decode_dps153_to_state, SUBSTATUS_DESCRIPTIONS, RobovacState
+from .vacuum import decode_dps153_to_state, parse_battery_level, SUBSTATUS_DESCRIPTIONS, RobovacState
 
 _LOGGER = logging.getLogger(__name__)
 
+# DPS 5 modes reported while the robot sits on the dock
+CHARGING_MODES = frozenset({"charge", "docked", "Charging"})
+CHARGING_SUBSTATUSES = frozenset({"charging", "fully_charged"})
+MOP_WASHING_SUBSTATUSES = frozenset({"mop_washing", "mop_washing_pre"})
+
 
 def decode_varint(data: bytes, start_pos: int) -> tuple[int, int]:
     """Decode Protocol Buffer varint format.
@@ -25,6 +31,12 @@ def decode_varint(data: bytes, start_pos: int) -> tuple[int, int]:
     Returns:
         tuple: (decoded_value, next_position)
     """
+    # Fast path: tags and most values we read fit in a single byte
+    if start_pos < len(data):
+        byte = data[start_pos]
+        if not (byte & 0x80):
+            return byte, start_pos + 1
+
     value = 0
     shift = 0
     pos = start_pos
@@ -40,6 +52,7 @@ def decode_varint(data: bytes, start_pos: int) -> tuple[int, int]:
     return value, pos
 
 
+@functools.lru_cache(maxsize=8)
 def parse_dps167_statistics(dps167_value: str) -> dict[str, int | None]:
     """Parse cumulative cleaning statistics from DPS 167.
 
@@ -50,6 +63,9 @@ def parse_dps167_statistics(dps167_value: str) -> dict[str, int | None]:
     Verified on FW 7.0.168 against the Eufy app's "掃除履歴" header
     (count / area / total time) — see ``feature/room-cleaning`` branch
     notes for the raw byte walkthrough.
+
+    Results are cached per raw value since all statistics sensors parse the
+    same DPS 167 string on every update; callers must not mutate the dict.
     """
     stats: dict[str, int | None] = {
         "total_count": None,
@@ -84,14 +100,16 @@ def parse_dps167_statistics(dps167_value: str) -> dict[str, int | None]:
     return stats
 
 
-def _parse_protobuf_fields(data: bytes) -> dict[int, int | bytes]:
+def _parse_protobuf_fields(data: bytes | memoryview) -> dict[int, int | memoryview]:
     """Walk a protobuf message and return {field_number: value}.
 
     Only varint (wire type 0) and length-delimited (wire type 2) fields are
     decoded — that's all DPS 167/168 use. Repeated fields keep the last
     value, which is sufficient for the singular fields we care about.
+    Length-delimited values are returned as zero-copy ``memoryview`` slices.
     """
-    fields: dict[int, int | bytes] = {}
+    data = memoryview(data)
+    fields: dict[int, int | memoryview] = {}
     pos = 0
     while pos < len(data):
         tag, pos = decode_varint(data, pos)
@@ -136,6 +154,7 @@ CONSUMABLE_ITEMS: list[tuple[int, str, str, int, str]] = [
 ]
 
 
+@functools.lru_cache(maxsize=8)
 def parse_dps168_consumables(dps168_value: str) -> dict[str, int | None]:
     """Parse per-component cumulative usage (in minutes) from DPS 168.
 
@@ -153,6 +172,9 @@ def parse_dps168_consumables(dps168_value: str) -> dict[str, int | None]:
       ``dustbag`` (field 7) is always emitted this way on S1 Pro.
     - Component present with a Duration submessage: read field 22 as the
       cumulative usage in minutes.
+
+    Cached like ``parse_dps167_statistics`` — every consumable sensor parses
+    the same DPS 168 string.
     """
     usage: dict[str, int | None] = {key: None for _, key, *_ in CONSUMABLE_ITEMS}
 
@@ -164,14 +186,14 @@ def parse_dps168_consumables(dps168_value: str) -> dict[str, int | None]:
         # Strip the 1-byte length prefix, then drill into runtime (field 1).
         outer = _parse_protobuf_fields(data[1:])
         runtime = outer.get(1)
-        if not isinstance(runtime, (bytes, bytearray)):
+        if not isinstance(runtime, memoryview):
             return usage
 
         runtime_fields = _parse_protobuf_fields(runtime)
 
         for field_num, key, *_ in CONSUMABLE_ITEMS:
             entry = runtime_fields.get(field_num)
-            if not isinstance(entry, (bytes, bytearray)):
+            if not isinstance(entry, memoryview):
                 continue  # field absent — let caller fall back to cache
             if len(entry) == 0:
                 usage[key] = 0  # empty Item == freshly reset (usage 0)
@@ -248,12 +270,13 @@ class BaseDPSensorEntity(CoordinatorTuyaDeviceUniqueIDMixin, CoordinatorEntity,
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.data is not None and self.dps_id in self.coordinator.data
+        data = self.coordinator.data
+        return data is not None and self.dps_id in data
 
     @property
     def native_value(self):
-        if self.coordinator.data:
-            value = self.coordinator.data.get(self.dps_id)
+        if data := self.coordinator.data:
+            value = data.get(self.dps_id)
             if converter := getattr(self, "parse_value", None):
                 try:
                     return converter(value)
@@ -273,38 +296,23 @@ class BatteryPercentageSensor(CoordinatorTuyaDeviceUniqueIDMixin, CoordinatorEnt
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.data is not None and ("8" in self.coordinator.data or "163" in self.coordinator.data)
+        data = self.coordinator.data
+        return data is not None and (
+            RobovacDPs.ROBOVAC_BATTERY_DPS_ID_8 in data or RobovacDPs.ROBOVAC_BATTERY_DPS_ID_163 in data
+        )
 
     @property
     def icon(self) -> str:
         # Check if charging based on DPS 5 (mode)
-        mode = (self.coordinator.data or {}).get("5", "")
-        charging = mode in ["charge", "docked", "Charging"]
+        mode = (self.coordinator.data or {}).get(RobovacDPs.ROBOVAC_CLEAN_MODE_DPS_ID_5, "")
+        charging = mode in CHARGING_MODES
         
         return icon_for_battery_level(self.native_value, charging=charging)
 
     @property
     def native_value(self) -> int | None:
-        if self.coordinator.data:
-            # S1 Pro uses DPS 8 for battery
-            value = self.coordinator.data.get("8")
-            if value is not None:
-                try:
-                    battery = int(value)
-                    if 0 <= battery <= 100:
-                        return battery
-                except (ValueError, TypeError):
-                    pass
-            
-            # Fallback to DPS 163
-            value = self.coordinator.data.get("163")
-            if value is not None:
-                try:
-                    battery = int(value)
-                    if 0 <= battery <= 100:
-                        return battery
-                except (ValueError, TypeError):
-                    pass
+        if data := self.coordinator.data:
+            return parse_battery_level(data)
         return None
 
 
@@ -334,17 +342,21 @@ class RunningStatusSensor(CoordinatorTuyaDeviceUniqueIDMixin, CoordinatorEntity,
     @property
     def available(self) -> bool:
         """Available if we have live data or a restored value."""
-        has_live = self.coordinator.data is not None and ("153" in self.coordinator.data or "2" in self.coordinator.data)
+        data = self.coordinator.data
+        has_live = data is not None and (
+            RobovacDPs.ROBOVAC_STATUS_DETAIL_DPS_ID_153 in data or RobovacDPs.ROBOVAC_PLAY_OR_PAUSE_DPS_ID_2 in data
+        )
         return has_live or self._restored_value is not None
     
     @property
     def native_value(self) -> str:
         """Return the detailed running status based on DPS 153."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return self._restored_value or "Unknown"
         
         # Check DPS 153 first (most reliable for S1 Pro)
-        dps153 = self.coordinator.data.get("153", "")
+        dps153 = data.get(RobovacDPs.ROBOVAC_STATUS_DETAIL_DPS_ID_153, "")
         
         if dps153:
             # 新しいバイトパターン判定ロジックを使用
@@ -354,14 +366,16 @@ class RunningStatusSensor(CoordinatorTuyaDeviceUniqueIDMixin, CoordinatorEntity,
             status_description = SUBSTATUS_DESCRIPTIONS.get(substatus, "Unknown")
             
             _LOGGER.debug(
-                f"Running Status: state={detected_state.value}, "
-                f"substatus={substatus}, description={status_description}"
+                "Running Status: state=%s, substatus=%s, description=%s",
+                detected_state.value,
+                substatus,
+                status_description,
             )
             
             return status_description
         
         # Fallback to DPS 2 if DPS 153 is not available
-        dps2 = self.coordinator.data.get("2")
+        dps2 = data.get(RobovacDPs.ROBOVAC_PLAY_OR_PAUSE_DPS_ID_2)
         if dps2 is True:
             return "Running"
         elif dps2 is False:
@@ -372,10 +386,11 @@ class RunningStatusSensor(CoordinatorTuyaDeviceUniqueIDMixin, CoordinatorEntity,
     @property
     def icon(self) -> str:
         """Return icon based on current state."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return "mdi:robot-vacuum"
         
-        dps153 = self.coordinator.data.get("153", "")
+        dps153 = data.get(RobovacDPs.ROBOVAC_STATUS_DETAIL_DPS_ID_153, "")
         
         if dps153:
             detected_state, substatus = decode_dps153_to_state(dps153)
@@ -389,11 +404,11 @@ class RunningStatusSensor(CoordinatorTuyaDeviceUniqueIDMixin, CoordinatorEntity,
                 return "mdi:home-import-outline"
             elif detected_state == RobovacState.DOCKED:
                 # サブステータスに応じたアイコン
-                if substatus in ["charging", "fully_charged"]:
+                if substatus in CHARGING_SUBSTATUSES:
                     return "mdi:battery-charging"
                 elif substatus == "dust_collecting":
                     return "mdi:delete-empty"
-                elif substatus in ["mop_washing", "mop_washing_pre"]:
+                elif substatus in MOP_WASHING_SUBSTATUSES:
                     return "mdi:spray-bottle"
                 elif substatus == "mop_drying":
                     return "mdi:fan"
@@ -438,16 +453,18 @@ class TotalCleaningCountSensor(CoordinatorTuyaDeviceUniqueIDMixin, CoordinatorEn
     @property
     def available(self) -> bool:
         """Available if we have live data or a restored value."""
-        has_live = self.coordinator.data is not None and "167" in self.coordinator.data
+        data = self.coordinator.data
+        has_live = data is not None and RobovacDPs.ROBOVAC_CLEAN_STATISTICS_DPS_ID_167 in data
         return has_live or self._last_valid_count is not None
     
     @property
     def native_value(self) -> int | None:
         """Return the total cleaning count."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return self._last_valid_count
         
-        dps167 = self.coordinator.data.get("167", "")
+        dps167 = data.get(RobovacDPs.ROBOVAC_CLEAN_STATISTICS_DPS_ID_167, "")
         if not dps167:
             return self._last_valid_count
         
@@ -496,16 +513,18 @@ class TotalCleaningAreaSensor(CoordinatorTuyaDeviceUniqueIDMixin, CoordinatorEnt
     @property
     def available(self) -> bool:
         """Available if we have live data or a restored value."""
-        has_live = self.coordinator.data is not None and "167" in self.coordinator.data
+        data = self.coordinator.data
+        has_live = data is not None and RobovacDPs.ROBOVAC_CLEAN_STATISTICS_DPS_ID_167 in data
         return has_live or self._last_valid_area is not None
     
     @property
     def native_value(self) -> int | None:
         """Return the total cleaning area in square meters."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return self._last_valid_area
         
-        dps167 = self.coordinator.data.get("167", "")
+        dps167 = data.get(RobovacDPs.ROBOVAC_CLEAN_STATISTICS_DPS_ID_167, "")
         if not dps167:
             return self._last_valid_area
         
@@ -555,16 +574,18 @@ class TotalCleaningTimeSensor(CoordinatorTuyaDeviceUniqueIDMixin, CoordinatorEnt
     @property
     def available(self) -> bool:
         """Available if we have live data or a restored value."""
-        has_live = self.coordinator.data is not None and "167" in self.coordinator.data
+        data = self.coordinator.data
+        has_live = data is not None and RobovacDPs.ROBOVAC_CLEAN_STATISTICS_DPS_ID_167 in data
         return has_live or self._last_valid_minutes is not None
 
     @property
     def native_value(self) -> int | None:
         """Return the total cleaning time in minutes."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return self._last_valid_minutes
 
-        dps167 = self.coordinator.data.get("167", "")
+        dps167 = data.get(RobovacDPs.ROBOVAC_CLEAN_STATISTICS_DPS_ID_167, "")
         if not dps167:
             return self._last_valid_minutes
 
@@ -626,15 +647,17 @@ class ConsumableRemainingSensor(CoordinatorTuyaDeviceUniqueIDMixin, CoordinatorE
 
     @property
     def available(self) -> bool:
-        has_live = self.coordinator.data is not None and "168" in self.coordinator.data
+        data = self.coordinator.data
+        has_live = data is not None and RobovacDPs.ROBOVAC_CONSUMABLES_DPS_ID_168 in data
         return has_live or self._last_valid_pct is not None
 
     @property
     def native_value(self) -> int | None:
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return self._last_valid_pct
 
-        dps168 = self.coordinator.data.get("168", "")
+        dps168 = data.get(RobovacDPs.ROBOVAC_CONSUMABLES_DPS_ID_168, "")
         if not dps168:
             return self._last_valid_pct
 
@@ -1,6 +1,6 @@
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -8,6 +8,10 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from .const import CONF_COORDINATOR, CONF_DISCOVERED_DEVICES, DOMAIN, RobovacDPs
 from .mixins import CoordinatorTuyaDeviceUniqueIDMixin
 
+# String values the device may report instead of a bool
+TRUE_VALUES = frozenset({"true", "1", "on"})
+FALSE_VALUES = frozenset({"false", "0", "off"})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -35,23 +39,38 @@ class AutoReturnCleaningSwitch(CoordinatorTuyaDeviceUniqueIDMixin, CoordinatorEn
     _attr_icon = "mdi:autorenew"
     _attr_entity_category = EntityCategory.CONFIG
 
+    def __init__(self, coordinator):
+        super().__init__(coordinator)
+        self._update_available()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._update_available()
+        super()._handle_coordinator_update()
+
+    def _update_available(self) -> None:
+        data = self.coordinator.data
+        self._attr_available = data is not None and RobovacDPs.ROBOVAC_AUTO_RETURN_CLEAN_DPS_ID_156 in data
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.data is not None and RobovacDPs.ROBOVAC_AUTO_RETURN_CLEAN_DPS_ID_156 in self.coordinator.data
+        # CoordinatorEntity.available would shadow _attr_available, so return it explicitly
+        return self._attr_available
 
     @property
     def is_on(self) -> bool | None:
-        if self.coordinator.data:
-            value = self.coordinator.data.get(RobovacDPs.ROBOVAC_AUTO_RETURN_CLEAN_DPS_ID_156)
+        if data := self.coordinator.data:
+            value = data.get(RobovacDPs.ROBOVAC_AUTO_RETURN_CLEAN_DPS_ID_156)
             
-            if isinstance(value, bool):
+            if type(value) is bool:
                 return value
             elif value is not None:
                 # Try to convert string values
-                if str(value).lower() in ['true', '1', 'on']:
+                value = str(value).lower()
+                if value in TRUE_VALUES:
                     return True
-                elif str(value).lower() in ['false', '0', 'off']:
+                elif value in FALSE_VALUES:
                     return False
         return None
 
@@ -3,6 +3,7 @@ from typing import Any
 import asyncio
 import base64
 from enum import Enum
+from types import MappingProxyType
 
 from homeassistant.components.vacuum import (
     StateVacuumEntity,
@@ -10,36 +11,35 @@ from homeassistant.components.vacuum import (
     VacuumActivity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_COORDINATOR, CONF_DISCOVERED_DEVICES, DOMAIN
+from .const import CONF_COORDINATOR, CONF_DISCOVERED_DEVICES, DOMAIN, RobovacDPs
 
 logger = logging.getLogger(__name__)
 
-
 # S1 Pro actual fan speed mappings (from app testing)
-HA_TO_EUFY_FAN_SPEED_MAP = {
+HA_TO_EUFY_FAN_SPEED_MAP = MappingProxyType({
     "Quiet": ("gentle", "Quiet"),      # DPS 9: gentle, DPS 158: Quiet
     "Standard": ("normal", "Standard"), # DPS 9: normal, DPS 158: Standard  
     "Turbo": ("strong", "Turbo"),      # DPS 9: strong, DPS 158: Turbo
     "Maximum": ("max", "Max")           # DPS 9: max, DPS 158: Max
-}
-
-# Reverse mapping for display
-EUFY_TO_HA_FAN_SPEED_MAP = {
-    "gentle": "Quiet",
-    "normal": "Standard",
-    "strong": "Turbo",
-    "max": "Maximum",
-    "Quiet": "Quiet",
-    "Standard": "Standard",
-    "Turbo": "Turbo",
-    "Max": "Maximum",
+})
+
+# Reverse mapping for display (DPS 9 and DPS 158 values alike)
+EUFY_TO_HA_FAN_SPEED_MAP = MappingProxyType({
+    **{
+        eufy_speed: ha_speed
+        for ha_speed, eufy_speeds in HA_TO_EUFY_FAN_SPEED_MAP.items()
+        for eufy_speed in eufy_speeds
+    },
     "middle": "Standard",  # Fallback
-}
+})
+
+# Maximum time to wait for the device to report a state change after a command
+COMMAND_STATE_CHANGE_TIMEOUT = 2.0
 
 # S1 Pro Command definitions for DPS 152 (from actual app logs)
 S1_PRO_COMMANDS = {
@@ -49,6 +49,13 @@ S1_PRO_COMMANDS = {
     "return": "AggG",       # ステーション帰還
 }
 
+# DPS 5 mode sent together with a DPS 152 command for consistency
+S1_PRO_COMMAND_MODES = {
+    S1_PRO_COMMANDS["start"]: "smart",
+    S1_PRO_COMMANDS["pause"]: "pause",
+    S1_PRO_COMMANDS["return"]: "charge",
+}
+
 
 class RobovacState(Enum):
     """ロボット掃除機の状態定義"""
@@ -60,6 +67,34 @@ class RobovacState(Enum):
     UNKNOWN = "unknown"
 
 
+# 判定結果ごとの (アクティビティ, 一時停止フラグ)
+# フラグがNoneの場合は一時停止フラグを変更しない
+
+# dps153から判定した状態 (UNKNOWNはIDLE扱い)
+ROBOVAC_STATE_TO_ACTIVITY = {
+    RobovacState.CLEANING: (VacuumActivity.CLEANING, False),
+    RobovacState.PAUSED: (VacuumActivity.PAUSED, True),
+    RobovacState.RETURNING: (VacuumActivity.RETURNING, False),
+    RobovacState.DOCKED: (VacuumActivity.DOCKED, False),
+    RobovacState.ERROR: (VacuumActivity.ERROR, None),
+}
+UNKNOWN_STATE_ACTIVITY = (VacuumActivity.IDLE, None)
+
+# dps153が無い場合のDPS 152コマンドによるフォールバック
+DPS152_TO_ACTIVITY = {
+    S1_PRO_COMMANDS["cleaning"]: (VacuumActivity.CLEANING, False),
+    S1_PRO_COMMANDS["pause"]: (VacuumActivity.PAUSED, True),
+    S1_PRO_COMMANDS["return"]: (VacuumActivity.RETURNING, False),
+}
+
+# 旧ロジック: DPS 6/7の組み合わせによるフォールバック ((0, 0)はバッテリー残量で判定)
+DPS67_TO_ACTIVITY = {
+    (2, 3): (VacuumActivity.CLEANING, False),
+    (3, 4): (VacuumActivity.PAUSED, True),
+    (1, 2): (VacuumActivity.RETURNING, False),
+}
+
+
 def decode_dps153_to_state(dps153_value: str) -> tuple[RobovacState, str]:
     """
     dps153の値からロボット掃除機の状態とサブステータスを判定
@@ -88,15 +123,14 @@ def decode_dps153_to_state(dps153_value: str) -> tuple[RobovacState, str]:
         
         # 最低限の長さチェック
         if len(decoded) < 3:
-            logger.warning(f"dps153 data too short: {len(decoded)} bytes")
+            logger.warning("dps153 data too short: %s bytes", len(decoded))
             return RobovacState.UNKNOWN, "unknown"
         
         byte1 = decoded[1]
         byte2 = decoded[2]
         
         # デバッグログ
-        hex_str = ' '.join([f"{b:02x}" for b in decoded])
-        logger.debug(f"dps153 decoded: {hex_str}")
+        logger.debug("dps153 decoded: %s", decoded.hex(" "))
         
         # ========== 主要な状態判定 ==========
         
@@ -131,11 +165,11 @@ def decode_dps153_to_state(dps153_value: str) -> tuple[RobovacState, str]:
             return RobovacState.DOCKED, substatus
         
         # デフォルトはDocked (未知のパターンでも安全側に倒す)
-        logger.warning(f"Unknown dps153 pattern, defaulting to DOCKED: {hex_str}")
+        logger.warning("Unknown dps153 pattern, defaulting to DOCKED: %s", decoded.hex(" "))
         return RobovacState.DOCKED, "idle"
         
     except Exception as e:
-        logger.error(f"Error decoding dps153: {e}", exc_info=True)
+        logger.error("Error decoding dps153: %s", e, exc_info=True)
         return RobovacState.UNKNOWN, "error"
 
 
@@ -190,6 +224,17 @@ def _get_docked_substatus(decoded: bytes) -> str:
     return "idle"
 
 
+def parse_battery_level(data: dict[str, Any]) -> int | None:
+    """Return the battery level from DPS 8 (S1 Pro), falling back to DPS 163."""
+    for dps_id in (RobovacDPs.ROBOVAC_BATTERY_DPS_ID_8, RobovacDPs.ROBOVAC_BATTERY_DPS_ID_163):
+        value = data.get(dps_id)
+        if isinstance(value, str) and value.isdecimal():
+            value = int(value)
+        if isinstance(value, int) and 0 <= value <= 100:
+            return value
+    return None
+
+
 # サブステータスの人間が読める説明文
 SUBSTATUS_DESCRIPTIONS = {
     "charging": "Charging",
@@ -243,11 +288,117 @@ class RobovacVacuum(CoordinatorEntity, StateVacuumEntity):
         self._substatus = None  # サブステータスを保持
         self._detected_state = None  # 判定された状態を保持
 
+        # DPS 152/153の変化をコマンド送信側に通知する
+        self._state_event = asyncio.Event()
+        self._last_status_dps = None
+
+        # コマンドは順番に一つずつ実行する
+        self._command_queue: asyncio.Queue = asyncio.Queue()
+        self._command_task: asyncio.Task | None = None
+        self._last_queued_command = None
+
+        # コーディネーター更新ごとに一度だけ計算した状態
+        self._cached_activity = None
+        self._cached_battery_level = None
+        self._cached_error_code = None
+        self._cached_fan_speed = None
+        self._cached_is_running = False
+        self._cached_icon = "mdi:robot-vacuum"
+        self._last_state_signature = None
+        self._update_cached_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Start the command worker."""
+        await super().async_added_to_hass()
+        self._command_task = self.hass.async_create_background_task(
+            self._command_worker(), f"{DOMAIN} command worker {self.unique_id}"
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop the command worker."""
+        if self._command_task:
+            self._command_task.cancel()
+            self._command_task = None
+        await super().async_will_remove_from_hass()
+
+    async def _command_worker(self) -> None:
+        """Run queued vacuum operations one at a time, in the order they were requested."""
+        while True:
+            command = await self._command_queue.get()
+            try:
+                await command()
+            except Exception:
+                logger.exception("Vacuum command %s failed", command.__name__)
+            finally:
+                self._command_queue.task_done()
+
+    async def _queue_command(self, command) -> None:
+        """Queue a vacuum operation, dropping it if it repeats the one still waiting."""
+        if not self._command_queue.empty() and command == self._last_queued_command:
+            logger.debug("Skipping duplicate queued command %s", command.__name__)
+            return
+        self._last_queued_command = command
+        await self._command_queue.put(command)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the cached state before writing it to Home Assistant."""
+        data = self.coordinator.data or {}
+        # DPS 152 echoes the command just sent, so only trust it when DPS 153 is not reported
+        if RobovacDPs.ROBOVAC_STATUS_DETAIL_DPS_ID_153 in data:
+            status_dp = RobovacDPs.ROBOVAC_STATUS_DETAIL_DPS_ID_153
+        else:
+            status_dp = RobovacDPs.ROBOVAC_COMMAND_DPS_ID_152
+        status_dps = (status_dp, data.get(status_dp))
+        if status_dps != self._last_status_dps:
+            self._last_status_dps = status_dps
+            self._state_event.set()
+
+        self._update_cached_state()
+
+        # Only write the state if something this entity exposes actually changed
+        state_signature = (
+            self._cached_activity,
+            self._cached_battery_level,
+            self._cached_fan_speed,
+            self._cached_error_code,
+            self.coordinator.last_update_success,
+        )
+        if state_signature == self._last_state_signature:
+            return
+        self._last_state_signature = state_signature
+
+        super()._handle_coordinator_update()
+
+    def _update_cached_state(self) -> None:
+        """Derive the entity state from the latest coordinator data."""
+        data = self.coordinator.data
+        if not data:
+            self._cached_activity = None
+            self._cached_battery_level = None
+            self._cached_error_code = None
+            self._cached_fan_speed = None
+            self._cached_is_running = False
+            self._cached_icon = "mdi:robot-vacuum"
+            return
+
+        # DPS 153 is decoded once and shared by the activity and running checks
+        dps153 = data.get(RobovacDPs.ROBOVAC_STATUS_DETAIL_DPS_ID_153)
+        dps153_state = decode_dps153_to_state(dps153) if dps153 else None
+
+        # The activity fallback reads the parsed battery level, so compute it first
+        self._cached_battery_level = parse_battery_level(data)
+        self._cached_activity = self._compute_activity(data, dps153_state)
+        self._cached_error_code = self._compute_error_code(data)
+        self._cached_fan_speed = self._compute_fan_speed(data)
+        self._cached_is_running = self._compute_is_running(data, dps153_state)
+        self._cached_icon = (
+            "mdi:robot-vacuum-alert" if self._cached_activity == VacuumActivity.ERROR else "mdi:robot-vacuum"
+        )
+
     @property
     def icon(self) -> str:
-        if self.activity == VacuumActivity.ERROR:
-            return "mdi:robot-vacuum-alert"
-        return "mdi:robot-vacuum"
+        return self._cached_icon
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -265,14 +416,17 @@ class RobovacVacuum(CoordinatorEntity, StateVacuumEntity):
     @property
     def activity(self) -> VacuumActivity | None:
         """Return the current activity of the vacuum."""
-        if not self.coordinator.data:
-            return None
-            
+        return self._cached_activity
+
+    def _compute_activity(
+        self, data: dict[str, Any], dps153_state: tuple[RobovacState, str] | None
+    ) -> VacuumActivity:
+        """Determine the current activity from DPS values and the decoded DPS 153 state."""
         # S1 Pro status detection based on actual DPS values
-        dps6 = self.coordinator.data.get("6", 0)      # Status indicator 1
-        dps153 = self.coordinator.data.get("153", "")  # Actual status indicator (most reliable)
+        dps6 = data.get(RobovacDPs.ROBOVAC_STATUS_DPS_ID_6, 0)      # Status indicator 1
+        dps153 = data.get(RobovacDPs.ROBOVAC_STATUS_DETAIL_DPS_ID_153, "")  # Actual status indicator (most reliable)
         
-        logger.debug(f"Activity check - DPS 6: {dps6}, DPS 153: {dps153}")
+        logger.debug("Activity check - DPS 6: %s, DPS 153: %s", dps6, dps153)
         
         # Error detection
         if isinstance(dps6, int) and dps6 >= 100:
@@ -281,65 +435,38 @@ class RobovacVacuum(CoordinatorEntity, StateVacuumEntity):
             return VacuumActivity.ERROR
         
         # Check DPS 153 status using improved pattern-based detection
-        if dps153:
-            detected_state, substatus = decode_dps153_to_state(dps153)
+        if dps153_state:
+            detected_state, substatus = dps153_state
             
             # 判定結果を保持
             self._detected_state = detected_state
             self._substatus = substatus
             
-            logger.debug(f"Detected state: {detected_state.value}, substatus: {substatus}")
+            logger.debug("Detected state: %s, substatus: %s", detected_state.value, substatus)
             
-            # 状態に応じたフラグ更新と値の返却
-            if detected_state == RobovacState.CLEANING:
-                self._was_paused = False
-                return VacuumActivity.CLEANING
-            elif detected_state == RobovacState.PAUSED:
-                self._was_paused = True
-                return VacuumActivity.PAUSED
-            elif detected_state == RobovacState.RETURNING:
-                self._was_paused = False
-                return VacuumActivity.RETURNING
-            elif detected_state == RobovacState.DOCKED:
-                self._was_paused = False
-                return VacuumActivity.DOCKED
-            elif detected_state == RobovacState.ERROR:
-                return VacuumActivity.ERROR
-            else:  # UNKNOWN
-                # 未知の状態はIDLEとして扱う
-                return VacuumActivity.IDLE
+            # 状態に応じたフラグ更新と値の返却 (未知の状態はIDLEとして扱う)
+            activity, was_paused = ROBOVAC_STATE_TO_ACTIVITY.get(detected_state, UNKNOWN_STATE_ACTIVITY)
+            if was_paused is not None:
+                self._was_paused = was_paused
+            return activity
         
         # DPS 153が利用できない場合のフォールバック
         # (互換性のために旧ロジックを一部残す)
-        dps152 = self.coordinator.data.get("152", "")
-        dps6 = self.coordinator.data.get("6", 0)
-        dps7 = self.coordinator.data.get("7", 0)
+        dps152 = data.get(RobovacDPs.ROBOVAC_COMMAND_DPS_ID_152, "")
+        dps7 = data.get(RobovacDPs.ROBOVAC_STATUS_DPS_ID_7, 0)
         
-        logger.debug(f"Fallback to DPS 152/6/7 - DPS 152: {dps152}, DPS 6: {dps6}, DPS 7: {dps7}")
+        logger.debug("Fallback to DPS 152/6/7 - DPS 152: %s, DPS 6: %s, DPS 7: %s", dps152, dps6, dps7)
         
-        if dps152 == S1_PRO_COMMANDS["cleaning"] or dps152 == "AggO":
-            self._was_paused = False
-            return VacuumActivity.CLEANING
-        elif dps152 == S1_PRO_COMMANDS["pause"] or dps152 == "AggN":
-            self._was_paused = True
-            return VacuumActivity.PAUSED
-        elif dps152 == S1_PRO_COMMANDS["return"] or dps152 == "AggG":
-            self._was_paused = False
-            return VacuumActivity.RETURNING
+        if entry := DPS152_TO_ACTIVITY.get(dps152):
+            activity, self._was_paused = entry
+            return activity
         
         # Fallback to DPS 6/7 combination
-        if dps6 == 2 and dps7 == 3:
-            self._was_paused = False
-            return VacuumActivity.CLEANING
-        elif dps6 == 3 and dps7 == 4:
-            self._was_paused = True
-            return VacuumActivity.PAUSED
-        elif dps6 == 1 and dps7 == 2:
-            self._was_paused = False
-            return VacuumActivity.RETURNING
+        if entry := DPS67_TO_ACTIVITY.get((dps6, dps7)):
+            activity, self._was_paused = entry
+            return activity
         elif dps6 == 0 and dps7 == 0:
-            battery = self.coordinator.data.get("8", 0)
-            if battery >= 95:
+            if (self._cached_battery_level or 0) >= 95:
                 return VacuumActivity.DOCKED
             else:
                 return VacuumActivity.IDLE
@@ -350,86 +477,65 @@ class RobovacVacuum(CoordinatorEntity, StateVacuumEntity):
     @property
     def battery_level(self) -> int | None:
         """Returns the battery level as a percentage"""
-        if self.coordinator.data:
-            # S1 Pro uses DPS 8 for battery level (confirmed from logs)
-            value = self.coordinator.data.get("8")
-            if value is not None:
-                try:
-                    battery = int(value)
-                    if 0 <= battery <= 100:
-                        return battery
-                except (ValueError, TypeError):
-                    pass
-            
-            # Fallback to DPS 163
-            value = self.coordinator.data.get("163")
-            if value is not None:
-                try:
-                    battery = int(value)
-                    if 0 <= battery <= 100:
-                        return battery
-                except (ValueError, TypeError):
-                    pass
-        return None
+        return self._cached_battery_level
 
     @property
     def state_attributes(self) -> dict[str, Any]:
         """Return the state attributes of the vacuum."""
-        attrs = super().state_attributes or {}
+        # The parent builds a fresh dict with battery and fan speed attributes
+        # on every call, so it can be extended in place
+        attrs = super().state_attributes
         
-        if self.coordinator.data:
-            # Only include essential attributes for end users
-            if error_code := self.error_code:
-                attrs["error_code"] = error_code
+        # Only include essential attributes for end users
+        if self._cached_error_code:
+            attrs["error_code"] = self._cached_error_code
             
         return attrs
     
     def _is_running(self) -> bool:
         """Check if vacuum is actually running based on multiple indicators."""
-        if self.coordinator.data:
-            dps153 = self.coordinator.data.get("153", "")
-            
-            # Check DPS 153 first (most reliable)
-            if dps153:
-                detected_state, _ = decode_dps153_to_state(dps153)
-                return detected_state == RobovacState.CLEANING
-            
-            # Fallback to DPS 152 if DPS 153 is not available
-            dps152 = self.coordinator.data.get("152", "")
-            if dps152 == S1_PRO_COMMANDS["cleaning"] or dps152 == "AggO":
-                return True
-            
-            # Final fallback to DPS 6/7
-            dps6 = self.coordinator.data.get("6", 0)
-            dps7 = self.coordinator.data.get("7", 0)
-            return (dps6 == 2 and dps7 == 3)
-                
-        return False
+        return self._cached_is_running
+
+    @staticmethod
+    def _compute_is_running(data: dict[str, Any], dps153_state: tuple[RobovacState, str] | None) -> bool:
+        # Check DPS 153 first (most reliable)
+        if dps153_state:
+            return dps153_state[0] == RobovacState.CLEANING
+        
+        # Fallback to DPS 152 if DPS 153 is not available
+        if data.get(RobovacDPs.ROBOVAC_COMMAND_DPS_ID_152) == S1_PRO_COMMANDS["cleaning"]:
+            return True
+        
+        # Final fallback to DPS 6/7
+        dps6 = data.get(RobovacDPs.ROBOVAC_STATUS_DPS_ID_6, 0)
+        dps7 = data.get(RobovacDPs.ROBOVAC_STATUS_DPS_ID_7, 0)
+        return (dps6 == 2 and dps7 == 3)
 
     @property
     def error_code(self) -> str | None:
         """Return error code if any."""
-        if self.coordinator.data:
-            # Check if DPS 6 has an error value (high numbers)
-            error_code = self.coordinator.data.get("6")
-            if isinstance(error_code, int) and error_code >= 100:
-                return str(error_code)
+        return self._cached_error_code
+
+    @staticmethod
+    def _compute_error_code(data: dict[str, Any]) -> str | None:
+        # Check if DPS 6 has an error value (high numbers)
+        error_code = data.get(RobovacDPs.ROBOVAC_STATUS_DPS_ID_6)
+        if isinstance(error_code, int) and error_code >= 100:
+            return str(error_code)
         return None
 
     @property
     def fan_speed(self) -> str | None:
         """Return the current fan speed."""
-        if self.coordinator.data:
-            # Check DPS 9 first (primary)
-            raw_speed = self.coordinator.data.get("9")
-            if raw_speed and raw_speed in EUFY_TO_HA_FAN_SPEED_MAP:
-                return EUFY_TO_HA_FAN_SPEED_MAP[raw_speed]
-            
-            # Check DPS 158 as fallback
-            raw_speed = self.coordinator.data.get("158")
-            if raw_speed and raw_speed in EUFY_TO_HA_FAN_SPEED_MAP:
-                return EUFY_TO_HA_FAN_SPEED_MAP[raw_speed]
-        return None
+        return self._cached_fan_speed
+
+    @staticmethod
+    def _compute_fan_speed(data: dict[str, Any]) -> str | None:
+        # Check DPS 9 first (primary), DPS 158 as fallback
+        return (
+            EUFY_TO_HA_FAN_SPEED_MAP.get(data.get(RobovacDPs.ROBOVAC_FAN_SPEED_DPS_ID_9))
+            or EUFY_TO_HA_FAN_SPEED_MAP.get(data.get(RobovacDPs.ROBOVAC_FAN_SPEED_DPS_ID_158))
+        )
 
     @property
     def fan_speed_list(self) -> list[str]:
@@ -438,63 +544,46 @@ class RobovacVacuum(CoordinatorEntity, StateVacuumEntity):
 
     async def _send_command(self, command: str) -> None:
         """Send command via DPS 152."""
+        logger.info("Sending command via DPS 152: %s", command)
+
+        # Store last command for debugging
+        self._last_command = command
+        self._last_command_time = asyncio.get_running_loop().time()
+
+        # Send command to DPS 152 together with the matching DPS 5 mode. A Tuya SET
+        # carries any number of DPS, so both go out in one frame on one connection.
+        payload = {RobovacDPs.ROBOVAC_COMMAND_DPS_ID_152: command}
+        if mode := S1_PRO_COMMAND_MODES.get(command):
+            payload[RobovacDPs.ROBOVAC_CLEAN_MODE_DPS_ID_5] = mode
+        self._state_event.clear()
+        await self.coordinator.tuya_client.async_set(payload)
+
+        # Wait until the device reports the new status (or give up after the timeout)
         try:
-            logger.info(f"Sending command via DPS 152: {command}")
-            
-            # Store last command for debugging
-            self._last_command = command
-            self._last_command_time = asyncio.get_event_loop().time()
-            
-            # Send command to DPS 152
-            await self.coordinator.tuya_client.async_set({"152": command})
-            
-            # Wait for response
-            await asyncio.sleep(0.5)
-            
-            # Also set appropriate mode for consistency
-            if command == S1_PRO_COMMANDS["start"]:
-                await self.coordinator.tuya_client.async_set({"5": "smart"})
-            elif command == S1_PRO_COMMANDS["pause"]:
-                await self.coordinator.tuya_client.async_set({"5": "pause"})
-            elif command == S1_PRO_COMMANDS["return"]:
-                await self.coordinator.tuya_client.async_set({"5": "charge"})
-            
-            # Wait and refresh state
-            await asyncio.sleep(1.0)
-            await self.coordinator.async_request_refresh()
-            
-        except Exception as e:
-            logger.error(f"Failed to send command: {e}")
-            raise
+            await asyncio.wait_for(self._state_event.wait(), timeout=COMMAND_STATE_CHANGE_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.debug("No status change reported for command %s", command)
+
+        # Refresh state
+        await self.coordinator.async_request_refresh()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the vacuum on and start cleaning."""
+        await self._queue_command(self._async_turn_on)
+
+    async def _async_turn_on(self) -> None:
         logger.info("Starting vacuum cleaning via DPS 152")
-        
-        try:
-            # Clear pause state
-            self._was_paused = False
-            
-            # Send start command
-            await self._send_command(S1_PRO_COMMANDS["start"])
-            
-            # Wait for state to stabilize
-            await asyncio.sleep(2.0)
-            
-            # Send cleaning command to confirm
-            await self._send_command(S1_PRO_COMMANDS["cleaning"])
-            
-            # Final refresh
-            await self.coordinator.async_request_refresh()
-            
-            if self._is_running():
-                logger.info("Vacuum started successfully")
-            else:
-                logger.warning("Vacuum may not have started properly")
-                
-        except Exception as e:
-            logger.error(f"Failed to start vacuum: {e}")
-            raise
+
+        # Clear pause state
+        self._was_paused = False
+
+        # Send start command, the device moves on to cleaning by itself
+        await self._send_command(S1_PRO_COMMANDS["start"])
+
+        if self._is_running():
+            logger.info("Vacuum started successfully")
+        else:
+            logger.warning("Vacuum may not have started properly")
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the vacuum off."""
@@ -503,24 +592,20 @@ class RobovacVacuum(CoordinatorEntity, StateVacuumEntity):
 
     async def async_start(self) -> None:
         """Start or resume cleaning."""
+        await self._queue_command(self._async_start)
+
+    async def _async_start(self) -> None:
         logger.debug("Starting/resuming cleaning")
         
-        # Check current state
-        activity = self.activity
-        current_dps152 = self.coordinator.data.get("152", "")
-        current_dps153 = self.coordinator.data.get("153", "")
-        
-        # dps153の判定を新しいロジックで行う
-        is_paused_by_dps153 = False
-        if current_dps153:
-            detected_state, _ = decode_dps153_to_state(current_dps153)
-            is_paused_by_dps153 = (detected_state == RobovacState.PAUSED)
-        
         # 一時停止状態からの再開か確認
-        if (activity == VacuumActivity.PAUSED or 
-            self._was_paused or 
-            is_paused_by_dps153 or
-            current_dps152 == S1_PRO_COMMANDS["pause"]):
+        # (dps153/6/7による判定はキャッシュ済みのアクティビティに反映されている。
+        # dps153がある場合はdps152が無視されるため、dps152の一時停止も直接確認する)
+        dps152 = (self.coordinator.data or {}).get(RobovacDPs.ROBOVAC_COMMAND_DPS_ID_152)
+        if (
+            self._cached_activity == VacuumActivity.PAUSED
+            or self._was_paused
+            or dps152 == S1_PRO_COMMANDS["pause"]
+        ):
             # 一時停止からの再開 - cleaningコマンドのみ送信
             logger.info("Resuming from pause - sending cleaning command only")
             
@@ -533,10 +618,13 @@ class RobovacVacuum(CoordinatorEntity, StateVacuumEntity):
         else:
             # 新規開始（「掃除を開始」のアナウンス）
             logger.info("Starting new cleaning session")
-            await self.async_turn_on()
+            await self._async_turn_on()
 
     async def async_pause(self) -> None:
         """Pause the vacuum."""
+        await self._queue_command(self._async_pause)
+
+    async def _async_pause(self) -> None:
         logger.debug("Pausing vacuum via DPS 152")
         
         try:
@@ -548,7 +636,7 @@ class RobovacVacuum(CoordinatorEntity, StateVacuumEntity):
             
             logger.info("Vacuum paused")
         except Exception as e:
-            logger.error(f"Failed to pause vacuum: {e}")
+            logger.error("Failed to pause vacuum: %s", e)
             self._was_paused = False  # エラー時はリセット
 
     async def async_stop(self, **kwargs: Any) -> None:
@@ -558,6 +646,9 @@ class RobovacVacuum(CoordinatorEntity, StateVacuumEntity):
 
     async def async_return_to_base(self, **kwargs: Any) -> None:
         """Return vacuum to base."""
+        await self._queue_command(self._async_return_to_base)
+
+    async def _async_return_to_base(self) -> None:
         logger.debug("Returning to base via DPS 152")
         
         try:
@@ -569,7 +660,7 @@ class RobovacVacuum(CoordinatorEntity, StateVacuumEntity):
             
             logger.info("Return to base command sent")
         except Exception as e:
-            logger.error(f"Failed to return to base: {e}")
+            logger.error("Failed to return to base: %s", e)
 
     async def async_clean_spot(self, **kwargs: Any) -> None:
         """Perform a spot clean-up - Not supported on S1 Pro."""
@@ -583,21 +674,21 @@ class RobovacVacuum(CoordinatorEntity, StateVacuumEntity):
 
     async def async_set_fan_speed(self, fan_speed: str, **kwargs: Any) -> None:
         """Set the vacuum's fan speed."""
-        if fan_speed not in HA_TO_EUFY_FAN_SPEED_MAP:
-            logger.error(f"Invalid fan speed: {fan_speed}")
+        try:
+            dps9_value, dps158_value = HA_TO_EUFY_FAN_SPEED_MAP[fan_speed]
+        except KeyError:
+            logger.error("Invalid fan speed: %s", fan_speed)
             return
             
-        logger.debug(f"Setting fan speed to {fan_speed}")
+        logger.debug("Setting fan speed to %s", fan_speed)
         
         try:
-            dps9_value, dps158_value = HA_TO_EUFY_FAN_SPEED_MAP[fan_speed]
-            
             # Set both DPS values for S1 Pro
             await self.coordinator.tuya_client.async_set({
-                "9": dps9_value,
-                "158": dps158_value
+                RobovacDPs.ROBOVAC_FAN_SPEED_DPS_ID_9: dps9_value,
+                RobovacDPs.ROBOVAC_FAN_SPEED_DPS_ID_158: dps158_value
             })
             
-            logger.info(f"Fan speed set to {fan_speed}")
+            logger.info("Fan speed set to %s", fan_speed)
         except Exception as e:
-            logger.error(f"Failed to set fan speed: {e}")
+            logger.error("Failed to set fan speed: %s", e)